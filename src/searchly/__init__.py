@@ -5,7 +5,9 @@ Provides unified search interfaces across multiple search providers.
 
 from __future__ import annotations
 
+import importlib
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 from searchly.base import (
     CountryCode,
@@ -17,36 +19,42 @@ from searchly.base import (
     WebSearchResponse,
     WebSearchResult,
 )
-from searchly_config import (
-    BaseSearchProviderConfig,
-    BraveSearchConfig,
-    DataForSEOConfig,
-    ExaConfig,
-    JigsawStackConfig,
-    KagiConfig,
-    LinkUpConfig,
-    NewsSearchProviderConfig,
-    NewsSearchProviderName,
-    Search1Config,
-    SerperConfig,
-    SerpAPIConfig,
-    TavilyConfig,
-    WebSearchProviderConfig,
-    WebSearchProviderName,
-    YouConfig,
-    get_config_class,
-)
-from searchly.providers.brave_provider.client import AsyncBraveSearch
-from searchly.providers.dataforseo_provider.dataforseo import AsyncDataForSEOClient
-from searchly.providers.exa_provider.exa import AsyncExaClient
-from searchly.providers.jigsawstack_provider.jigsawstack import AsyncJigsawStackClient
-from searchly.providers.kagi_provider.client import AsyncKagiClient
-from searchly.providers.linkup_provider.client import AsyncLinkUpClient
-from searchly.providers.search1_provider.client import AsyncSearch1API
-from searchly.providers.serpapi_provider.client import AsyncSerpAPIClient
-from searchly.providers.serper_provider.client import AsyncSerperClient
-from searchly.providers.tavily_provider.client import AsyncTavilyClient
-from searchly.providers.you_provider.you import AsyncYouClient
+from searchly.providers import _lazy as _providers
+
+
+if TYPE_CHECKING:
+    from searchly_config import (
+        BaseSearchProviderConfig,
+        BraveSearchConfig,
+        DataForSEOConfig,
+        ExaConfig,
+        JigsawStackConfig,
+        KagiConfig,
+        LinkUpConfig,
+        NEWS_CONFIG_ADAPTER,
+        NewsSearchProviderConfig,
+        NewsSearchProviderName,
+        Search1Config,
+        SerperConfig,
+        SerpAPIConfig,
+        TavilyConfig,
+        WEB_CONFIG_ADAPTER,
+        WebSearchProviderConfig,
+        WebSearchProviderName,
+        YouConfig,
+        get_config_class,
+    )
+    from searchly.providers.brave_provider.client import AsyncBraveSearch
+    from searchly.providers.dataforseo_provider.dataforseo import AsyncDataForSEOClient
+    from searchly.providers.exa_provider.exa import AsyncExaClient
+    from searchly.providers.jigsawstack_provider.jigsawstack import AsyncJigsawStackClient
+    from searchly.providers.kagi_provider.client import AsyncKagiClient
+    from searchly.providers.linkup_provider.client import AsyncLinkUpClient
+    from searchly.providers.search1_provider.client import AsyncSearch1API
+    from searchly.providers.serpapi_provider.client import AsyncSerpAPIClient
+    from searchly.providers.serper_provider.client import AsyncSerperClient
+    from searchly.providers.tavily_provider.client import AsyncTavilyClient
+    from searchly.providers.you_provider.you import AsyncYouClient
 
 
 __version__ = version("searchly")
@@ -58,7 +66,50 @@ __copyright__ = "Copyright (c) 2025 Philipp Temminghoff"
 __license__ = "MIT"
 __url__ = "https://github.com/phil65/searchly"
 
+# Provider clients and configs are resolved on first attribute access (PEP 562),
+# so importing searchly only pays for the providers which are actually used.
+_CONFIG_NAMES = frozenset({
+    "BaseSearchProviderConfig",
+    "BraveSearchConfig",
+    "DataForSEOConfig",
+    "ExaConfig",
+    "JigsawStackConfig",
+    "KagiConfig",
+    "LinkUpConfig",
+    "NEWS_CONFIG_ADAPTER",
+    "NewsSearchProviderConfig",
+    "NewsSearchProviderName",
+    "Search1Config",
+    "SerpAPIConfig",
+    "SerperConfig",
+    "TavilyConfig",
+    "WEB_CONFIG_ADAPTER",
+    "WebSearchProviderConfig",
+    "WebSearchProviderName",
+    "YouConfig",
+    "get_config_class",
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _providers.__all__:
+        value = getattr(_providers, name)
+    elif name in _CONFIG_NAMES:
+        value = getattr(importlib.import_module("searchly_config"), name)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_providers.__all__, *_CONFIG_NAMES])
+
+
 __all__ = [
+    "NEWS_CONFIG_ADAPTER",
+    "WEB_CONFIG_ADAPTER",
     "AsyncBraveSearch",
     "AsyncDataForSEOClient",
     "AsyncExaClient",
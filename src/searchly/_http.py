@@ -0,0 +1,126 @@
+"""Pooled HTTP client support shared by the provider clients."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from typing import TYPE_CHECKING, Any, Self
+
+import anyenv
+import httpx
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from types import TracebackType
+
+
+HTTP2 = importlib.util.find_spec("h2") is not None
+"""Whether HTTP/2 is available (needs the optional h2 package, searchly[http2])."""
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+"""Connection pool limits, matching the httpx defaults."""
+
+
+def check_response(response: httpx.Response) -> httpx.Response:
+    """Raise anyenv's `ResponseError` for 4xx/5xx responses.
+
+    Keeps errors consistent with the providers requesting through anyenv.
+
+    Args:
+        response: The response to check.
+
+    Returns:
+        The same response if it is not an error.
+    """
+    if response.is_error:
+        from anyenv.download.httpx_backend import HttpxResponse
+
+        msg = f"HTTP Error {response.status_code}"
+        raise anyenv.ResponseError(msg, HttpxResponse(response))
+    return response
+
+
+class PooledHTTPClient:
+    """Mixin for providers holding a pooled httpx client.
+
+    Keep-alive connections are reused across requests; the pool is released
+    with `close()` or by using the provider as an async context manager.
+    An httpx client is bound to the event loop it first runs on, so a new one
+    is created when the provider is used from another loop, e.g. by
+    successive `asyncio.run()` calls.
+    """
+
+    _client: httpx.AsyncClient | None = None
+    _client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _setup_http(
+        self,
+        base_url: str,
+        *,
+        headers: Mapping[str, str] | Sequence[tuple[bytes, bytes]],
+        timeout: float,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        retries: int = 0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Configure the pooled client, using HTTP/2 when h2 is installed.
+
+        Args:
+            base_url: Base URL for all requests.
+            headers: Headers sent with every request.
+            timeout: Request timeout in seconds.
+            limits: Connection pool limits.
+            retries: Number of retries for failed connection attempts.
+            transport: Custom transport (e.g. `httpx.MockTransport` in tests).
+                Replaces the pooled default, so `limits` and `retries` are ignored.
+        """
+        self._client_options: dict[str, Any] = {
+            "base_url": base_url,
+            "headers": headers,
+            "timeout": timeout,
+        }
+        self._transport = transport
+        self._limits = limits
+        self._retries = retries
+
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        """The pooled client for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is None or client.is_closed or self._client_loop is not loop:
+            transport = self._transport or httpx.AsyncHTTPTransport(
+                retries=self._retries,
+                limits=self._limits,
+                http2=HTTP2,
+            )
+            self._client = client = httpx.AsyncClient(**self._client_options, transport=transport)
+            self._client_loop = loop
+        return client
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, raising anyenv's `RequestError` on connection failures."""
+        try:
+            return await self._http.request(method, url, **kwargs)
+        except httpx.RequestError as exc:
+            msg = f"Request failed: {exc!s}"
+            raise anyenv.RequestError(msg) from exc
+
+    async def close(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        client, self._client = self._client, None
+        # A client of an earlier, finished loop lost its connections with that loop
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
@@ -0,0 +1,66 @@
+"""Lazily resolved provider clients.
+
+Accessing a client attribute on this module imports the provider module on
+first use and caches the class, so configs and the top-level package can
+refer to every provider without importing any of them upfront.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from searchly.providers.brave_provider.client import AsyncBraveSearch
+    from searchly.providers.dataforseo_provider.dataforseo import AsyncDataForSEOClient
+    from searchly.providers.exa_provider.exa import AsyncExaClient
+    from searchly.providers.jigsawstack_provider.jigsawstack import AsyncJigsawStackClient
+    from searchly.providers.kagi_provider.client import AsyncKagiClient
+    from searchly.providers.linkup_provider.client import AsyncLinkUpClient
+    from searchly.providers.search1_provider.client import AsyncSearch1API
+    from searchly.providers.serpapi_provider.client import AsyncSerpAPIClient
+    from searchly.providers.serper_provider.client import AsyncSerperClient
+    from searchly.providers.tavily_provider.client import AsyncTavilyClient
+    from searchly.providers.you_provider.you import AsyncYouClient
+
+
+_MODULES: dict[str, str] = {
+    "AsyncBraveSearch": "searchly.providers.brave_provider.client",
+    "AsyncDataForSEOClient": "searchly.providers.dataforseo_provider.dataforseo",
+    "AsyncExaClient": "searchly.providers.exa_provider.exa",
+    "AsyncJigsawStackClient": "searchly.providers.jigsawstack_provider.jigsawstack",
+    "AsyncKagiClient": "searchly.providers.kagi_provider.client",
+    "AsyncLinkUpClient": "searchly.providers.linkup_provider.client",
+    "AsyncSearch1API": "searchly.providers.search1_provider.client",
+    "AsyncSerpAPIClient": "searchly.providers.serpapi_provider.client",
+    "AsyncSerperClient": "searchly.providers.serper_provider.client",
+    "AsyncTavilyClient": "searchly.providers.tavily_provider.client",
+    "AsyncYouClient": "searchly.providers.you_provider.you",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_path = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "AsyncBraveSearch",
+    "AsyncDataForSEOClient",
+    "AsyncExaClient",
+    "AsyncJigsawStackClient",
+    "AsyncKagiClient",
+    "AsyncLinkUpClient",
+    "AsyncSearch1API",
+    "AsyncSerpAPIClient",
+    "AsyncSerperClient",
+    "AsyncTavilyClient",
+    "AsyncYouClient",
+]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from searchly.base import (
     CountryCode,  # noqa: TC001
@@ -14,6 +14,10 @@ from searchly.base import (
 )
 
 
+if TYPE_CHECKING:
+    from exa_py import AsyncExa
+
+
 class AsyncExaClient(WebSearchProvider):
     """Async client for Exa API.
 
@@ -27,18 +31,25 @@ class AsyncExaClient(WebSearchProvider):
         Args:
             api_key: Exa API key. Defaults to EXA_API_KEY env var.
         """
-        try:
-            from exa_py import AsyncExa
-        except ImportError as e:
-            msg = "Could not import exa_py."
-            raise ImportError(msg) from e
-
         self.api_key = api_key or os.getenv("EXA_API_KEY")
         if not self.api_key:
             msg = "No API key provided. Set EXA_API_KEY env var or pass api_key"
             raise ValueError(msg)
 
-        self.client = AsyncExa(api_key=self.api_key)
+        self._client: AsyncExa | None = None
+
+    @property
+    def client(self) -> AsyncExa:
+        """The underlying exa_py client, imported and created on first access."""
+        if self._client is None:
+            try:
+                from exa_py import AsyncExa
+            except ImportError as e:
+                msg = "Could not import exa_py."
+                raise ImportError(msg) from e
+
+            self._client = AsyncExa(api_key=self.api_key)
+        return self._client
 
     async def web_search(
         self,
@@ -101,9 +112,9 @@ class AsyncExaClient(WebSearchProvider):
                 url=result.url,
                 snippet=result.text or result.summary or "",
             )
-            for result in response.results
+            for result in response.results[:max_results]
         ]
-        return WebSearchResponse(results=results[:max_results])
+        return WebSearchResponse(results=results)
 
 
 async def example() -> None:
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 import os
-from typing import Any, Literal
+import time
+from typing import TYPE_CHECKING, Any, Literal
 
-import anyenv
+import httpx
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
+from searchly._http import HTTP2, PooledHTTPClient, check_response
 from searchly.base import (
     CountryCode,  # noqa: TC001
     LanguageCode,  # noqa: TC001
@@ -14,13 +19,67 @@ from searchly.base import (
     WebSearchResponse,
     WebSearchResult,
 )
+from searchly.log import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
 
 
 SummaryType = Literal["summary", "takeaway"]
 SummaryEngine = Literal["cecil", "agnes", "muriel"]
 
+_PendingSearch = tuple[dict[str, Any], asyncio.Future[bytes]]
+
+logger = get_logger("providers.kagi")
+
+_CACHE_MAXSIZE = 1024
+# Rate limiting and transient server errors, retried with a pause
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class KagiSearchItem(BaseModel):
+    """Raw item of a Kagi search response."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    t: int | None = None
+    """Item type (0 = search result, 1 = related searches)."""
+
+    url: str | None = None
+    title: str | None = None
+    snippet: str | None = None
+
+
+class KagiSearchResponse(BaseModel):
+    """Raw Kagi search response."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    data: list[KagiSearchItem] = []
+
+
+class KagiSummary(BaseModel):
+    """Raw summarizer result."""
+
+    model_config = ConfigDict(defer_build=True)
 
-class AsyncKagiClient(WebSearchProvider):
+    output: str = ""
+
+
+class KagiSummaryResponse(BaseModel):
+    """Raw Kagi summarizer response."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    data: KagiSummary | None = None
+
+
+# Built once, validating the whole list is cheaper than one model __init__ per item
+_WEB_ADAPTER = TypeAdapter(list[WebSearchResult], config=ConfigDict(defer_build=True))
+
+
+class AsyncKagiClient(PooledHTTPClient, WebSearchProvider):
     """Async client for Kagi API.
 
     Note: Kagi Search API requires API billing to be set up at
@@ -32,12 +91,33 @@ class AsyncKagiClient(WebSearchProvider):
         *,
         api_key: str | None = None,
         base_url: str = "https://kagi.com/api/v0",
+        timeout: float = 30.0,
+        retries: int = 0,
+        wait_time: float = 2,
+        batch: bool = False,
+        max_batch: int = 8,
+        max_wait_ms: float = 5.0,
+        cache_ttl: float | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """Initialize Kagi client.
 
         Args:
             api_key: Kagi API key. Defaults to KAGI_API_KEY env var.
             base_url: Base URL for the API.
+            timeout: Request timeout in seconds.
+            retries: Number of retries for failed requests. Connection errors are
+                retried by the transport on the same pool, HTTP 429/5xx responses
+                after waiting `wait_time`.
+            wait_time: Time to wait between retries of HTTP 429/5xx responses in seconds.
+            batch: Queue concurrent web searches and dispatch them in batches.
+            max_batch: Maximum number of searches dispatched together.
+            max_wait_ms: Maximum time to wait for a batch to fill up.
+            cache_ttl: Seconds to keep responses for identical requests in memory.
+                Concurrent identical requests share a single API call.
+                Caching is disabled if None or 0.
+            transport: Custom httpx transport, replacing the pooled default. Connection
+                retries are then up to the transport, HTTP 429/5xx retries still apply.
         """
         self.api_key = api_key or os.getenv("KAGI_API_KEY")
         if not self.api_key:
@@ -45,7 +125,62 @@ class AsyncKagiClient(WebSearchProvider):
             raise ValueError(msg)
 
         self.base_url = base_url
-        self.headers = {"Authorization": f"Bot {self.api_key}"}
+        # Encoded once, the pooled client reuses these raw header bytes per request
+        self._auth_token = f"Bot {self.api_key}".encode()
+        # One pooled client per instance, so keep-alive connections are reused.
+        # With HTTP/2, concurrent requests multiplex over few connections.
+        limits = (
+            httpx.Limits(max_connections=10, max_keepalive_connections=10)
+            if HTTP2
+            else httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        self._setup_http(
+            base_url,
+            headers=[(b"Authorization", self._auth_token)],
+            timeout=timeout,
+            limits=limits,
+            retries=retries,
+            transport=transport,
+        )
+        self.retries = retries
+        self.wait_time = wait_time
+        self._http_version_logged = False
+        self.batch = batch
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._queue: asyncio.Queue[_PendingSearch] | None = None
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+        self.cache_ttl = cache_ttl
+        self._cache: dict[Hashable, tuple[float, Any]] = {}
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def __repr__(self) -> str:
+        # Never include the API key or auth header
+        return (
+            f"{type(self).__name__}(base_url={self.base_url!r}, "
+            f"batch={self.batch!r}, cache_ttl={self.cache_ttl!r})"
+        )
+
+    async def close(self) -> None:
+        """Cancel queued and in-flight batched searches and close the HTTP client."""
+        dispatcher, self._dispatcher = self._dispatcher, None
+        queue, self._queue = self._queue, None
+        batches, self._batches = self._batches, set()
+        # Tasks of an earlier, finished loop are gone already
+        if dispatcher is not None and dispatcher.get_loop() is asyncio.get_running_loop():
+            dispatcher.cancel()
+            while queue is not None and not queue.empty():
+                _, future = queue.get_nowait()
+                future.cancel()
+            for batch in batches:
+                batch.cancel()
+            await asyncio.gather(dispatcher, *batches, return_exceptions=True)
+        await super().close()
+
+    def cache_clear(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
 
     async def web_search(
         self,
@@ -75,22 +210,145 @@ class AsyncKagiClient(WebSearchProvider):
         # country/language not documented in Kagi API - settings inherited from account
         _ = country, language
 
-        params: dict[str, Any] = {"q": query, "limit": max_results, **kwargs}
+        # kwargs is a fresh dict per call, so it doubles as the params dict
+        params = kwargs
+        params["q"] = query
+        params["limit"] = max_results
+        return WebSearchResponse(results=await self._search(params, max_results))
 
-        url = f"{self.base_url}/search"
-        data = await anyenv.get_json(url, params=params, headers=self.headers, return_type=dict)
+    async def _search(self, params: dict[str, Any], max_results: int) -> list[WebSearchResult]:
+        """Run a search request and convert its items to unified results."""
+        raw = await self._request("/search", params)
+        # Parse and validate straight from bytes, without an intermediate dict
+        data = KagiSearchResponse.model_validate_json(raw)
 
         # Filter to search results (t=0), excluding related searches (t=1)
-        results = [
-            WebSearchResult(
-                title=item.get("title") or "",
-                url=item.get("url") or "",
-                snippet=item.get("snippet") or "",
+        projected: list[dict[str, str]] = []
+        append = projected.append
+        for item in data.data:
+            if len(projected) >= max_results:
+                break
+            if item.t != 0 or not (url := item.url):
+                continue
+            append({"title": item.title or "", "url": url, "snippet": item.snippet or ""})
+        return _WEB_ADAPTER.validate_python(projected)
+
+    async def _request(self, path: str, params: dict[str, Any], *, cache: bool = True) -> bytes:
+        """Send a GET request through the cache and, for searches, the batch queue."""
+        if self.batch and path == "/search":
+            fetch = partial(self._submit, params)
+        else:
+            fetch = partial(self._get, path, params)
+        key = self._cache_key(path, params) if cache else None
+        return await self._cached(key, fetch)
+
+    async def _get(self, path: str, params: dict[str, Any]) -> bytes:
+        response = await self._send("GET", path, params=params)
+        for _ in range(self.retries):
+            if response.status_code not in _RETRY_STATUS:
+                break
+            await asyncio.sleep(self.wait_time)
+            response = await self._send("GET", path, params=params)
+        if not self._http_version_logged:
+            logger.debug("Kagi API negotiated %s", response.http_version)
+            self._http_version_logged = True
+        return check_response(response).content
+
+    def _cache_key(self, path: str, params: dict[str, Any]) -> Hashable | None:
+        """Build a cache key for a request, or None if it should not be cached."""
+        if not self.cache_ttl:
+            return None
+        key = (path, *sorted(params.items()))
+        try:
+            hash(key)
+        except TypeError:  # unhashable kwargs, e.g. lists
+            return None
+        return key
+
+    async def _cached[T](self, key: Hashable | None, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return a cached result for key, or run fetch once for all concurrent callers."""
+        if key is None:
+            return await fetch()
+        if (entry := self._cache.get(key)) is not None:
+            expires, value = entry
+            if expires > time.monotonic():
+                return value  # type: ignore[no-any-return]
+            del self._cache[key]
+        if (future := self._inflight.get(key)) is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(partial(self._store, key))
+        # Shielded, so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(future)
+
+    def _store(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        self._inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None or not self.cache_ttl:
+            return
+        if len(self._cache) >= _CACHE_MAXSIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + self.cache_ttl, future.result())
+
+    async def _submit(self, params: dict[str, Any]) -> bytes:
+        """Queue a search for the batch dispatcher and wait for its response."""
+        loop = asyncio.get_running_loop()
+        queue, dispatcher = self._queue, self._dispatcher
+        if (
+            queue is None
+            or dispatcher is None
+            or dispatcher.done()
+            or dispatcher.get_loop() is not loop
+        ):
+            self._queue = queue = asyncio.Queue()
+            self._dispatcher = loop.create_task(self._dispatch(queue))
+        future: asyncio.Future[bytes] = loop.create_future()
+        await queue.put((params, future))
+        return await future
+
+    async def _dispatch(self, queue: asyncio.Queue[_PendingSearch]) -> None:
+        """Drain the queue in batches of up to `max_batch` searches.
+
+        A batch is dispatched once it is full or `max_wait_ms` passed since its
+        first entry. Each batch runs as its own task, so batches overlap and
+        concurrency is bounded by the connection pool only.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+            try:
+                while len(pending) < self.max_batch:
+                    async with asyncio.timeout_at(deadline):
+                        pending.append(await queue.get())
+            except TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                for _, future in pending:
+                    future.cancel()
+                raise
+            batch = loop.create_task(self._run_batch(pending))
+            self._batches.add(batch)
+            batch.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, pending: list[_PendingSearch]) -> None:
+        """Send a batch of searches concurrently and resolve their futures."""
+        pending = [(params, future) for params, future in pending if not future.done()]
+        try:
+            results = await asyncio.gather(
+                *(self._get("/search", params) for params, _ in pending),
+                return_exceptions=True,
             )
-            for item in data.get("data", [])
-            if item.get("t") == 0 and item.get("url")
-        ]
-        return WebSearchResponse(results=results[:max_results])
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        for (_, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
     async def summarize(
         self,
@@ -138,30 +396,27 @@ class AsyncKagiClient(WebSearchProvider):
         if target_language:
             params["target_language"] = target_language
 
-        endpoint = f"{self.base_url}/summarize"
-        data = await anyenv.get_json(
-            endpoint, params=params, headers=self.headers, return_type=dict
-        )
-        return data.get("data", {}).get("output", "")  # type: ignore[no-any-return]
+        raw = await self._request("/summarize", params, cache=cache)
+        data = KagiSummaryResponse.model_validate_json(raw)
+        return data.data.output if data.data else ""
 
 
 async def example() -> None:
     """Example usage of AsyncKagiClient."""
-    client = AsyncKagiClient()
-
-    # Web search
-    web_results = await client.web_search("Python programming", max_results=5)
-    print(f"Web results: {len(web_results.results)}")
-    for result in web_results.results:
-        print(f"  - {result.title}: {result.url}")
-
-    # Summarization
-    summary = await client.summarize(
-        url="https://python.org",
-        engine="cecil",
-        summary_type="takeaway",
-    )
-    print(f"Summary: {summary}")
+    async with AsyncKagiClient() as client:
+        # Web search
+        web_results = await client.web_search("Python programming", max_results=5)
+        print(f"Web results: {len(web_results.results)}")
+        for result in web_results.results:
+            print(f"  - {result.title}: {result.url}")
+
+        # Summarization
+        summary = await client.summarize(
+            url="https://python.org",
+            engine="cecil",
+            summary_type="takeaway",
+        )
+        print(f"Summary: {summary}")
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ import os
 from typing import TYPE_CHECKING, Any, Literal
 
 import anyenv
+from pydantic import BaseModel, ConfigDict
 
 from searchly.base import (
     NewsSearchProvider,
@@ -23,6 +24,47 @@ if TYPE_CHECKING:
 
 TimePeriod = Literal["d", "w", "m", "y"]
 
+# Fixed query parameters shared by every request
+_BASE_PARAMS: dict[str, str] = {"engine": "google", "output": "json", "source": "python"}
+
+
+class SerpAPIOrganicResult(BaseModel):
+    """Raw organic search result."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    title: str = ""
+    link: str = ""
+    snippet: str = ""
+
+
+class SerpAPISearchResponse(BaseModel):
+    """Raw SerpAPI web search response."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    organic_results: list[SerpAPIOrganicResult] = []
+
+
+class SerpAPINewsResult(BaseModel):
+    """Raw news search result."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    title: str = ""
+    link: str = ""
+    snippet: str = ""
+    source: str | None = None
+    date: str | None = None
+
+
+class SerpAPINewsResponse(BaseModel):
+    """Raw SerpAPI news search response."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    news_results: list[SerpAPINewsResult] = []
+
 
 class AsyncSerpAPIClient(WebSearchProvider, NewsSearchProvider):
     """Async client for SerpAPI."""
@@ -66,12 +108,10 @@ class AsyncSerpAPIClient(WebSearchProvider, NewsSearchProvider):
             Unified web search response.
         """
         params: dict[str, Any] = {
+            **_BASE_PARAMS,
             "q": query,
             "num": max_results,
-            "engine": "google",
             "api_key": self.api_key,
-            "output": "json",
-            "source": "python",
             **kwargs,
         }
 
@@ -84,17 +124,14 @@ class AsyncSerpAPIClient(WebSearchProvider, NewsSearchProvider):
         if safe:
             params["safe"] = "active"
 
-        response = await anyenv.get_json(f"{self.BACKEND}/search", params=params, return_type=dict)
+        raw = await anyenv.get_bytes(f"{self.BACKEND}/search", params=params)
+        response = SerpAPISearchResponse.model_validate_json(raw)
 
         results = [
-            WebSearchResult(
-                title=item.get("title", ""),
-                url=item.get("link", ""),
-                snippet=item.get("snippet", ""),
-            )
-            for item in response.get("organic_results", [])
+            WebSearchResult(title=item.title, url=item.link, snippet=item.snippet)
+            for item in response.organic_results[:max_results]
         ]
-        return WebSearchResponse(results=results[:max_results])
+        return WebSearchResponse(results=results)
 
     async def news_search(
         self,
@@ -124,13 +161,11 @@ class AsyncSerpAPIClient(WebSearchProvider, NewsSearchProvider):
             Unified news search response.
         """
         params: dict[str, Any] = {
+            **_BASE_PARAMS,
             "q": query,
             "tbm": "nws",
             "num": max_results,
-            "engine": "google",
             "api_key": self.api_key,
-            "output": "json",
-            "source": "python",
             **kwargs,
         }
 
@@ -145,19 +180,20 @@ class AsyncSerpAPIClient(WebSearchProvider, NewsSearchProvider):
         if time_period:
             params["tbs"] = f"qdr:{time_period}"
 
-        response = await anyenv.get_json(f"{self.BACKEND}/search", params=params, return_type=dict)
+        raw = await anyenv.get_bytes(f"{self.BACKEND}/search", params=params)
+        response = SerpAPINewsResponse.model_validate_json(raw)
 
         results = [
             NewsSearchResult(
-                title=item.get("title", ""),
-                url=item.get("link", ""),
-                snippet=item.get("snippet", ""),
-                source=item.get("source"),
-                published=item.get("date"),
+                title=item.title,
+                url=item.link,
+                snippet=item.snippet,
+                source=item.source,
+                published=item.date,
             )
-            for item in response.get("news_results", [])
+            for item in response.news_results[:max_results]
         ]
-        return NewsSearchResponse(results=results[:max_results])
+        return NewsSearchResponse(results=results)
 
 
 async def example() -> None:
@@ -5,11 +5,12 @@ from __future__ import annotations
 from collections.abc import Sequence  # noqa: TC003
 import contextlib
 import os
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import anyenv
-import httpx
+from pydantic import BaseModel, ConfigDict
 
+from searchly._http import PooledHTTPClient
 from searchly.base import (
     CountryCode,  # noqa: TC001
     LanguageCode,  # noqa: TC001
@@ -23,10 +24,40 @@ from searchly.base import (
 from searchly.exceptions import InvalidAPIKeyError, MissingAPIKeyError, UsageLimitExceededError
 
 
+if TYPE_CHECKING:
+    import httpx
+
+
 SearchDepth = Literal["basic", "advanced"]
 
+# Only the result list is consumed, so never ask for the optional extras
+_BASE_BODY: dict[str, Any] = {
+    "include_answer": False,
+    "include_raw_content": False,
+    "include_images": False,
+}
+
+
+class TavilyResult(BaseModel):
+    """Raw Tavily search result."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    title: str = ""
+    url: str = ""
+    content: str = ""
+    published_date: str | None = None
+
+
+class TavilySearchResponse(BaseModel):
+    """Raw Tavily search response."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    results: list[TavilyResult] = []
 
-class AsyncTavilyClient(WebSearchProvider, NewsSearchProvider):
+
+class AsyncTavilyClient(PooledHTTPClient, WebSearchProvider, NewsSearchProvider):
     """Async client for Tavily API.
 
     Note: Tavily does not support country/language filtering directly.
@@ -34,11 +65,17 @@ class AsyncTavilyClient(WebSearchProvider, NewsSearchProvider):
     News search is implemented via the topic="news" parameter.
     """
 
-    def __init__(self, *, api_key: str | None = None):
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         """Initialize Tavily client.
 
         Args:
             api_key: Tavily API key. Defaults to TAVILY_API_KEY env var.
+            transport: Custom httpx transport, replacing the pooled default.
         """
         api_key = api_key or os.getenv("TAVILY_API_KEY")
         if not api_key:
@@ -48,9 +85,12 @@ class AsyncTavilyClient(WebSearchProvider, NewsSearchProvider):
         self.headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
         self.base_url = "https://api.tavily.com"
         self.timeout = 180
-
-    def _client_creator(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(headers=self.headers, base_url=self.base_url, timeout=self.timeout)
+        self._setup_http(
+            self.base_url,
+            headers=self.headers,
+            timeout=self.timeout,
+            transport=transport,
+        )
 
     async def _search(
         self,
@@ -63,36 +103,35 @@ class AsyncTavilyClient(WebSearchProvider, NewsSearchProvider):
         include_domains: Sequence[str] | None = None,
         exclude_domains: Sequence[str] | None = None,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> TavilySearchResponse:
         """Internal search method to send the request to the API."""
         data: dict[str, Any] = {
+            **_BASE_BODY,
             "query": query,
             "search_depth": search_depth,
             "topic": topic,
             "days": days,
             "max_results": max_results,
-            "include_domains": include_domains,
-            "exclude_domains": exclude_domains,
-            "include_answer": False,
-            "include_raw_content": False,
-            "include_images": False,
-            **kwargs,
         }
+        if include_domains is not None:
+            data["include_domains"] = include_domains
+        if exclude_domains is not None:
+            data["exclude_domains"] = exclude_domains
+        data.update(kwargs)
 
-        async with self._client_creator() as client:
-            response = await client.post("/search", content=anyenv.dump_json(data))
+        response = await self._http.post("/search", content=anyenv.dump_json(data))
 
         if response.status_code == 200:  # noqa: PLR2004
-            return response.json()  # type: ignore[no-any-return]
+            return TavilySearchResponse.model_validate_json(response.content)
         if response.status_code == 429:  # noqa: PLR2004
             detail = "Too many requests."
             with contextlib.suppress(Exception):
-                detail = response.json()["detail"]["error"]
+                detail = anyenv.load_json(response.content)["detail"]["error"]
             raise UsageLimitExceededError(detail)
         if response.status_code == 401:  # noqa: PLR2004
             raise InvalidAPIKeyError
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        return TavilySearchResponse.model_validate_json(response.content)
 
     async def web_search(
         self,
@@ -135,14 +174,10 @@ class AsyncTavilyClient(WebSearchProvider, NewsSearchProvider):
         )
 
         results = [
-            WebSearchResult(
-                title=item.get("title", ""),
-                url=item.get("url", ""),
-                snippet=item.get("content", ""),
-            )
-            for item in response.get("results", [])
+            WebSearchResult(title=item.title, url=item.url, snippet=item.content)
+            for item in response.results[:max_results]
         ]
-        return WebSearchResponse(results=results[:max_results])
+        return WebSearchResponse(results=results)
 
     async def news_search(
         self,
@@ -186,27 +221,26 @@ class AsyncTavilyClient(WebSearchProvider, NewsSearchProvider):
 
         results = [
             NewsSearchResult(
-                title=item.get("title", ""),
-                url=item.get("url", ""),
-                snippet=item.get("content", ""),
-                published=item.get("published_date"),
+                title=item.title,
+                url=item.url,
+                snippet=item.content,
+                published=item.published_date,
             )
-            for item in response.get("results", [])
+            for item in response.results[:max_results]
         ]
-        return NewsSearchResponse(results=results[:max_results])
+        return NewsSearchResponse(results=results)
 
 
 async def example() -> None:
     """Example usage of AsyncTavilyClient."""
-    client = AsyncTavilyClient()
-
-    web_results = await client.web_search("Python programming", max_results=5)
-    print(f"Web results: {len(web_results.results)}")
-    for result in web_results.results:
-        print(f"  - {result.title}: {result.url}")
-
-    news_results = await client.news_search("Python programming", max_results=5)
-    print(f"News results: {len(news_results.results)}")
+    async with AsyncTavilyClient() as client:
+        web_results = await client.web_search("Python programming", max_results=5)
+        print(f"Web results: {len(web_results.results)}")
+        for result in web_results.results:
+            print(f"  - {result.title}: {result.url}")
+
+        news_results = await client.news_search("Python programming", max_results=5)
+        print(f"News results: {len(news_results.results)}")
 
 
 if __name__ == "__main__":
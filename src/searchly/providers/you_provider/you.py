@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-import anyenv
+from pydantic import BaseModel, ConfigDict, Field
 
+from searchly._http import PooledHTTPClient, check_response
 from searchly.base import (
     CountryCode,  # noqa: TC001
     LanguageCode,  # noqa: TC001
@@ -19,11 +21,64 @@ from searchly.base import (
 )
 
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import httpx
+
+
 SafeSearchLevel = Literal["off", "moderate", "strict"]
 FreshnessFilter = Literal["day", "week", "month", "year"]
 
 
-class AsyncYouClient(WebSearchProvider, NewsSearchProvider):
+class YouHit(BaseModel):
+    """Raw web search hit."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    title: str = ""
+    url: str = ""
+    description: str = ""
+
+
+class YouSearchResponse(BaseModel):
+    """Raw You.com web search response."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    hits: list[YouHit] = []
+
+
+class YouNewsItem(BaseModel):
+    """Raw news search result."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    title: str = ""
+    url: str = ""
+    description: str = ""
+    source_name: str | None = None
+    age: str | None = None
+    page_age: str | None = None
+
+
+class YouNewsResults(BaseModel):
+    """Raw container of news search results."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    results: list[YouNewsItem] = []
+
+
+class YouNewsResponse(BaseModel):
+    """Raw You.com news search response."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    news: YouNewsResults = Field(default_factory=YouNewsResults)
+
+
+class AsyncYouClient(PooledHTTPClient, WebSearchProvider, NewsSearchProvider):
     """Async client for You.com API."""
 
     def __init__(
@@ -31,12 +86,16 @@ class AsyncYouClient(WebSearchProvider, NewsSearchProvider):
         *,
         api_key: str | None = None,
         base_url: str = "https://api.ydc-index.io",
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """Initialize You.com client.
 
         Args:
             api_key: You.com API key. Defaults to YOU_API_KEY env var.
             base_url: Base URL for the API.
+            timeout: Request timeout in seconds.
+            transport: Custom httpx transport, replacing the pooled default.
         """
         self.api_key = api_key or os.getenv("YOU_API_KEY")
         if not self.api_key:
@@ -45,6 +104,7 @@ class AsyncYouClient(WebSearchProvider, NewsSearchProvider):
 
         self.base_url = base_url
         self.headers = {"X-API-Key": self.api_key}
+        self._setup_http(base_url, headers=self.headers, timeout=timeout, transport=transport)
 
     async def web_search(
         self,
@@ -85,18 +145,31 @@ class AsyncYouClient(WebSearchProvider, NewsSearchProvider):
         if freshness:
             params["freshness"] = freshness
 
-        url = f"{self.base_url}/search"
-        response = await anyenv.get_json(url, headers=self.headers, params=params, return_type=dict)
+        http_response = check_response(await self._send("GET", "/search", params=params))
+        # Parse and validate straight from bytes, without an intermediate dict
+        response = YouSearchResponse.model_validate_json(http_response.content)
 
         results = [
-            WebSearchResult(
-                title=item.get("title", ""),
-                url=item.get("url", ""),
-                snippet=item.get("description", ""),
-            )
-            for item in response.get("hits", [])
+            WebSearchResult(title=hit.title, url=hit.url, snippet=hit.description)
+            for hit in response.hits[:max_results]
         ]
-        return WebSearchResponse(results=results[:max_results])
+        return WebSearchResponse(results=results)
+
+    async def web_search_many(
+        self,
+        queries: Sequence[str],
+        **kwargs: Any,
+    ) -> list[WebSearchResponse]:
+        """Execute several web search queries concurrently.
+
+        Args:
+            queries: Search query strings.
+            **kwargs: Options passed to `web_search` for every query.
+
+        Returns:
+            One unified web search response per query, in input order.
+        """
+        return await asyncio.gather(*(self.web_search(query, **kwargs) for query in queries))
 
     async def news_search(
         self,
@@ -127,42 +200,38 @@ class AsyncYouClient(WebSearchProvider, NewsSearchProvider):
         if max_results:
             params["count"] = max_results
 
-        url = f"{self.base_url}/news"
-        response = await anyenv.get_json(url, headers=self.headers, params=params, return_type=dict)
+        http_response = check_response(await self._send("GET", "/news", params=params))
+        response = YouNewsResponse.model_validate_json(http_response.content)
 
-        news_data = response.get("news", {})
         results = [
             NewsSearchResult(
-                title=item.get("title", ""),
-                url=item.get("url", ""),
-                snippet=item.get("description", ""),
-                source=item.get("source_name"),
-                published=item.get("age") or item.get("page_age"),
+                title=item.title,
+                url=item.url,
+                snippet=item.description,
+                source=item.source_name,
+                published=item.age or item.page_age,
             )
-            for item in news_data.get("results", [])
+            for item in response.news.results[:max_results]
         ]
-        return NewsSearchResponse(results=results[:max_results])
+        return NewsSearchResponse(results=results)
 
 
 async def example() -> None:
     """Example usage of AsyncYouClient."""
-    client = AsyncYouClient()
+    async with AsyncYouClient() as client:
+        web_results = await client.web_search(
+            "Python programming",
+            max_results=5,
+            country="US",
+            freshness="week",
+        )
+        print(f"Web results: {len(web_results.results)}")
+        for result in web_results.results:
+            print(f"  - {result.title}: {result.url}")
 
-    web_results = await client.web_search(
-        "Python programming",
-        max_results=5,
-        country="US",
-        freshness="week",
-    )
-    print(f"Web results: {len(web_results.results)}")
-    for result in web_results.results:
-        print(f"  - {result.title}: {result.url}")
-
-    news_results = await client.news_search("Python programming", max_results=5)
-    print(f"News results: {len(news_results.results)}")
+        news_results = await client.news_search("Python programming", max_results=5)
+        print(f"News results: {len(news_results.results)}")
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(example())
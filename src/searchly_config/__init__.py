@@ -14,12 +14,14 @@ from searchly_config.configs import (
     JigsawStackConfig,
     KagiConfig,
     LinkUpConfig,
+    NEWS_CONFIG_ADAPTER,
     NewsSearchProviderConfig,
     NewsSearchProviderName,
     Search1Config,
     SerpAPIConfig,
     SerperConfig,
     TavilyConfig,
+    WEB_CONFIG_ADAPTER,
     WebSearchProviderConfig,
     WebSearchProviderName,
     YouConfig,
@@ -28,6 +30,8 @@ from searchly_config.configs import (
 
 
 __all__ = [
+    "NEWS_CONFIG_ADAPTER",
+    "WEB_CONFIG_ADAPTER",
     "BaseSearchProviderConfig",
     "BraveSearchConfig",
     "DataForSEOConfig",
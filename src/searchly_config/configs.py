@@ -5,23 +5,14 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Annotated, Literal
 
-from pydantic import Field, SecretStr
+from pydantic import Discriminator, Field, PrivateAttr, SecretStr, TypeAdapter
 from schemez import Schema
 
+from searchly.providers import _lazy as _p
+
 
 if TYPE_CHECKING:
     from searchly.base import NewsSearchProvider, WebSearchProvider
-    from searchly.providers.brave_provider.client import AsyncBraveSearch
-    from searchly.providers.dataforseo_provider.dataforseo import AsyncDataForSEOClient
-    from searchly.providers.exa_provider.exa import AsyncExaClient
-    from searchly.providers.jigsawstack_provider.jigsawstack import AsyncJigsawStackClient
-    from searchly.providers.kagi_provider.client import AsyncKagiClient
-    from searchly.providers.linkup_provider.client import AsyncLinkUpClient
-    from searchly.providers.search1_provider.client import AsyncSearch1API
-    from searchly.providers.serpapi_provider.client import AsyncSerpAPIClient
-    from searchly.providers.serper_provider.client import AsyncSerperClient
-    from searchly.providers.tavily_provider.client import AsyncTavilyClient
-    from searchly.providers.you_provider.you import AsyncYouClient
 
 
 WebSearchProviderName = Literal[
@@ -47,6 +38,20 @@ class BaseSearchProviderConfig(Schema):
     type: str = Field(init=False)
     """Search provider type."""
 
+    _env_cache: dict[str, str | None] = PrivateAttr(default_factory=dict)
+
+    def _credential(self, value: SecretStr | None, env_var: str) -> str | None:
+        """Read a credential from its field, falling back to an env var.
+
+        The field is read on every call so assignments and copies take effect;
+        only the env var lookup is cached.
+        """
+        if value:
+            return value.get_secret_value()
+        if env_var not in self._env_cache:
+            self._env_cache[env_var] = os.getenv(env_var)
+        return self._env_cache[env_var]
+
     def is_configured(self) -> bool:
         """Check if the provider has required credentials configured.
 
@@ -58,6 +63,9 @@ class BaseSearchProviderConfig(Schema):
     def get_provider(self) -> WebSearchProvider | NewsSearchProvider:
         """Create the provider instance.
 
+        Providers holding a connection pool (Kagi, Tavily, You.com) should be
+        released with `await provider.close()` or used via `async with`.
+
         Returns:
             The configured provider instance.
         """
@@ -83,17 +91,19 @@ class BraveSearchConfig(BaseSearchProviderConfig):
     wait_time: int = Field(default=2, ge=0, title="Wait Time", examples=[1, 2, 5])
     """Time to wait between retries in seconds."""
 
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the BRAVE_API_KEY env var."""
+        return self._credential(self.api_key, "BRAVE_API_KEY")
+
     def is_configured(self) -> bool:
         """Check if Brave Search credentials are configured."""
-        return self.api_key is not None or os.getenv("BRAVE_API_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncBraveSearch:
+    def get_provider(self) -> _p.AsyncBraveSearch:
         """Create Brave Search provider instance."""
-        from searchly.providers.brave_provider.client import AsyncBraveSearch
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncBraveSearch(
-            api_key=api_key,
+        return _p.AsyncBraveSearch(
+            api_key=self._resolved_key,
             retries=self.retries,
             wait_time=self.wait_time,
         )
@@ -118,21 +128,25 @@ class DataForSEOConfig(BaseSearchProviderConfig):
     base_url: str = Field(default="https://api.dataforseo.com/v3", title="Base URL")
     """Base URL for the API."""
 
+    @property
+    def _resolved_login(self) -> str | None:
+        """Login from the field or the DATAFORSEO_LOGIN env var."""
+        return self._credential(self.login, "DATAFORSEO_LOGIN")
+
+    @property
+    def _resolved_password(self) -> str | None:
+        """Password from the field or the DATAFORSEO_PASSWORD env var."""
+        return self._credential(self.password, "DATAFORSEO_PASSWORD")
+
     def is_configured(self) -> bool:
         """Check if DataForSEO credentials are configured."""
-        has_login = self.login is not None or os.getenv("DATAFORSEO_LOGIN") is not None
-        has_password = self.password is not None or os.getenv("DATAFORSEO_PASSWORD") is not None
-        return has_login and has_password
+        return self._resolved_login is not None and self._resolved_password is not None
 
-    def get_provider(self) -> AsyncDataForSEOClient:
+    def get_provider(self) -> _p.AsyncDataForSEOClient:
         """Create DataForSEO provider instance."""
-        from searchly.providers.dataforseo_provider.dataforseo import AsyncDataForSEOClient
-
-        login = self.login.get_secret_value() if self.login else None
-        password = self.password.get_secret_value() if self.password else None
-        return AsyncDataForSEOClient(
-            login=login,
-            password=password,
+        return _p.AsyncDataForSEOClient(
+            login=self._resolved_login,
+            password=self._resolved_password,
             base_url=self.base_url,
         )
 
@@ -150,16 +164,18 @@ class ExaConfig(BaseSearchProviderConfig):
     api_key: SecretStr | None = Field(default=None, title="API Key")
     """Exa API key. Defaults to EXA_API_KEY env var."""
 
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the EXA_API_KEY env var."""
+        return self._credential(self.api_key, "EXA_API_KEY")
+
     def is_configured(self) -> bool:
         """Check if Exa credentials are configured."""
-        return self.api_key is not None or os.getenv("EXA_API_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncExaClient:
+    def get_provider(self) -> _p.AsyncExaClient:
         """Create Exa provider instance."""
-        from searchly.providers.exa_provider.exa import AsyncExaClient
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncExaClient(api_key=api_key)
+        return _p.AsyncExaClient(api_key=self._resolved_key)
 
 
 class JigsawStackConfig(BaseSearchProviderConfig):
@@ -178,16 +194,18 @@ class JigsawStackConfig(BaseSearchProviderConfig):
     base_url: str = Field(default="https://api.jigsawstack.com/v1", title="Base URL")
     """Base URL for the API."""
 
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the JIGSAWSTACK_API_KEY env var."""
+        return self._credential(self.api_key, "JIGSAWSTACK_API_KEY")
+
     def is_configured(self) -> bool:
         """Check if JigsawStack credentials are configured."""
-        return self.api_key is not None or os.getenv("JIGSAWSTACK_API_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncJigsawStackClient:
+    def get_provider(self) -> _p.AsyncJigsawStackClient:
         """Create JigsawStack provider instance."""
-        from searchly.providers.jigsawstack_provider.jigsawstack import AsyncJigsawStackClient
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncJigsawStackClient(api_key=api_key, base_url=self.base_url)
+        return _p.AsyncJigsawStackClient(api_key=self._resolved_key, base_url=self.base_url)
 
 
 class KagiConfig(BaseSearchProviderConfig):
@@ -206,16 +224,29 @@ class KagiConfig(BaseSearchProviderConfig):
     base_url: str = Field(default="https://kagi.com/api/v0", title="Base URL")
     """Base URL for the API."""
 
+    retries: int = Field(default=0, ge=0, title="Retries", examples=[0, 3, 5])
+    """Number of retries for failed requests."""
+
+    wait_time: int = Field(default=2, ge=0, title="Wait Time", examples=[1, 2, 5])
+    """Time to wait between retries in seconds."""
+
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the KAGI_API_KEY env var."""
+        return self._credential(self.api_key, "KAGI_API_KEY")
+
     def is_configured(self) -> bool:
         """Check if Kagi credentials are configured."""
-        return self.api_key is not None or os.getenv("KAGI_API_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncKagiClient:
+    def get_provider(self) -> _p.AsyncKagiClient:
         """Create Kagi provider instance."""
-        from searchly.providers.kagi_provider.client import AsyncKagiClient
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncKagiClient(api_key=api_key, base_url=self.base_url)
+        return _p.AsyncKagiClient(
+            api_key=self._resolved_key,
+            base_url=self.base_url,
+            retries=self.retries,
+            wait_time=self.wait_time,
+        )
 
 
 class LinkUpConfig(BaseSearchProviderConfig):
@@ -234,16 +265,18 @@ class LinkUpConfig(BaseSearchProviderConfig):
     base_url: str = Field(default="https://api.linkup.so/v1", title="Base URL")
     """Base URL for the API."""
 
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the LINKUP_API_KEY env var."""
+        return self._credential(self.api_key, "LINKUP_API_KEY")
+
     def is_configured(self) -> bool:
         """Check if LinkUp credentials are configured."""
-        return self.api_key is not None or os.getenv("LINKUP_API_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncLinkUpClient:
+    def get_provider(self) -> _p.AsyncLinkUpClient:
         """Create LinkUp provider instance."""
-        from searchly.providers.linkup_provider.client import AsyncLinkUpClient
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncLinkUpClient(api_key=api_key, base_url=self.base_url)
+        return _p.AsyncLinkUpClient(api_key=self._resolved_key, base_url=self.base_url)
 
 
 class Search1Config(BaseSearchProviderConfig):
@@ -265,16 +298,18 @@ class Search1Config(BaseSearchProviderConfig):
     )
     """Base URL for the API."""
 
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the SEARCH1API_KEY env var."""
+        return self._credential(self.api_key, "SEARCH1API_KEY")
+
     def is_configured(self) -> bool:
         """Check if Search1API credentials are configured."""
-        return self.api_key is not None or os.getenv("SEARCH1API_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncSearch1API:
+    def get_provider(self) -> _p.AsyncSearch1API:
         """Create Search1API provider instance."""
-        from searchly.providers.search1_provider.client import AsyncSearch1API
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncSearch1API(api_key=api_key, base_url=self.base_url)
+        return _p.AsyncSearch1API(api_key=self._resolved_key, base_url=self.base_url)
 
 
 class SerpAPIConfig(BaseSearchProviderConfig):
@@ -290,16 +325,18 @@ class SerpAPIConfig(BaseSearchProviderConfig):
     api_key: SecretStr | None = Field(default=None, title="API Key")
     """SerpAPI key. Defaults to SERPAPI_KEY env var."""
 
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the SERPAPI_KEY env var."""
+        return self._credential(self.api_key, "SERPAPI_KEY")
+
     def is_configured(self) -> bool:
         """Check if SerpAPI credentials are configured."""
-        return self.api_key is not None or os.getenv("SERPAPI_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncSerpAPIClient:
+    def get_provider(self) -> _p.AsyncSerpAPIClient:
         """Create SerpAPI provider instance."""
-        from searchly.providers.serpapi_provider.client import AsyncSerpAPIClient
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncSerpAPIClient(api_key=api_key)
+        return _p.AsyncSerpAPIClient(api_key=self._resolved_key)
 
 
 class SerperConfig(BaseSearchProviderConfig):
@@ -318,16 +355,18 @@ class SerperConfig(BaseSearchProviderConfig):
     base_url: str = Field(default="https://google.serper.dev", title="Base URL")
     """Base URL for the API."""
 
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the SERPER_API_KEY env var."""
+        return self._credential(self.api_key, "SERPER_API_KEY")
+
     def is_configured(self) -> bool:
         """Check if Serper credentials are configured."""
-        return self.api_key is not None or os.getenv("SERPER_API_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncSerperClient:
+    def get_provider(self) -> _p.AsyncSerperClient:
         """Create Serper provider instance."""
-        from searchly.providers.serper_provider.client import AsyncSerperClient
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncSerperClient(api_key=api_key, base_url=self.base_url)
+        return _p.AsyncSerperClient(api_key=self._resolved_key, base_url=self.base_url)
 
 
 class TavilyConfig(BaseSearchProviderConfig):
@@ -343,16 +382,18 @@ class TavilyConfig(BaseSearchProviderConfig):
     api_key: SecretStr | None = Field(default=None, title="API Key")
     """Tavily API key. Defaults to TAVILY_API_KEY env var."""
 
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the TAVILY_API_KEY env var."""
+        return self._credential(self.api_key, "TAVILY_API_KEY")
+
     def is_configured(self) -> bool:
         """Check if Tavily credentials are configured."""
-        return self.api_key is not None or os.getenv("TAVILY_API_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncTavilyClient:
+    def get_provider(self) -> _p.AsyncTavilyClient:
         """Create Tavily provider instance."""
-        from searchly.providers.tavily_provider.client import AsyncTavilyClient
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncTavilyClient(api_key=api_key)
+        return _p.AsyncTavilyClient(api_key=self._resolved_key)
 
 
 class YouConfig(BaseSearchProviderConfig):
@@ -371,16 +412,18 @@ class YouConfig(BaseSearchProviderConfig):
     base_url: str = Field(default="https://api.ydc-index.io", title="Base URL")
     """Base URL for the API."""
 
+    @property
+    def _resolved_key(self) -> str | None:
+        """API key from the field or the YOU_API_KEY env var."""
+        return self._credential(self.api_key, "YOU_API_KEY")
+
     def is_configured(self) -> bool:
         """Check if You.com credentials are configured."""
-        return self.api_key is not None or os.getenv("YOU_API_KEY") is not None
+        return self._resolved_key is not None
 
-    def get_provider(self) -> AsyncYouClient:
+    def get_provider(self) -> _p.AsyncYouClient:
         """Create You.com provider instance."""
-        from searchly.providers.you_provider.you import AsyncYouClient
-
-        api_key = self.api_key.get_secret_value() if self.api_key else None
-        return AsyncYouClient(api_key=api_key, base_url=self.base_url)
+        return _p.AsyncYouClient(api_key=self._resolved_key, base_url=self.base_url)
 
 
 # Union type for web search provider configurations (all providers support web search)
@@ -396,15 +439,20 @@ WebSearchProviderConfig = Annotated[
     | SerperConfig
     | TavilyConfig
     | YouConfig,
-    Field(discriminator="type"),
+    Discriminator("type"),
 ]
 
 # Union type for news search provider configurations (subset that supports news)
 NewsSearchProviderConfig = Annotated[
     BraveSearchConfig | DataForSEOConfig | SerpAPIConfig | SerperConfig | TavilyConfig | YouConfig,
-    Field(discriminator="type"),
+    Discriminator("type"),
 ]
 
+# Prebuilt validators for the config unions. Use e.g.
+# `WEB_CONFIG_ADAPTER.validate_python(raw)` instead of building a model per call.
+WEB_CONFIG_ADAPTER: TypeAdapter[WebSearchProviderConfig] = TypeAdapter(WebSearchProviderConfig)
+NEWS_CONFIG_ADAPTER: TypeAdapter[NewsSearchProviderConfig] = TypeAdapter(NewsSearchProviderConfig)
+
 
 def get_config_class(
     provider_name: WebSearchProviderName,
@@ -1 +1,55 @@
 from __future__ import annotations
+
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+import anyenv
+import pytest
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@dataclass
+class JSONServer:
+    """Local HTTP server answering GET requests with canned JSON payloads."""
+
+    url: str
+    responses: dict[str, tuple[int, Any]] = field(default_factory=dict)
+    """Status code and payload per request path."""
+    requests: list[tuple[str, dict[str, list[str]]]] = field(default_factory=list)
+    """Path and query parameters of every received request."""
+
+
+@pytest.fixture
+def json_server() -> Iterator[JSONServer]:
+    """Serve canned JSON over real sockets, for clients without a transport hook."""
+    server_state: JSONServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            server_state.requests.append((url.path, parse_qs(url.query)))
+            status, payload = server_state.responses.get(url.path, (404, {}))
+            body = anyenv.dump_json(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt: str, *args: object) -> None:
+            pass
+
+    with ThreadingHTTPServer(("127.0.0.1", 0), Handler) as server:
+        server_state = JSONServer(url=f"http://127.0.0.1:{server.server_port}")
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        yield server_state
+        server.shutdown()
@@ -0,0 +1,41 @@
+"""Tests for provider config credential resolution."""
+
+from __future__ import annotations
+
+from pydantic import SecretStr
+import pytest
+
+from searchly_config import DataForSEOConfig, TavilyConfig
+
+
+@pytest.fixture(autouse=True)
+def _clear_env(monkeypatch: pytest.MonkeyPatch):
+    for var in ("TAVILY_API_KEY", "DATAFORSEO_LOGIN", "DATAFORSEO_PASSWORD"):
+        monkeypatch.delenv(var, raising=False)
+
+
+def test_assigned_key_is_used_after_check():
+    config = TavilyConfig()
+    assert not config.is_configured()
+
+    config.api_key = SecretStr("real-key")
+    assert config.is_configured()
+    assert config.get_provider().api_key == "real-key"
+
+
+def test_copy_uses_updated_key():
+    config = TavilyConfig()
+    assert not config.is_configured()
+
+    copy = config.model_copy(update={"api_key": SecretStr("real-key")})
+    assert copy.get_provider().api_key == "real-key"
+    assert not config.is_configured()
+
+
+def test_env_var_fallback(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("DATAFORSEO_LOGIN", "env-login")
+    config = DataForSEOConfig(password=SecretStr("secret"))
+    assert config.is_configured()
+
+    config.login = SecretStr("field-login")
+    assert config._resolved_login == "field-login"
@@ -0,0 +1,31 @@
+"""Tests for lazy top-level imports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_providers():
+    code = "import sys, searchly; print(any(m.endswith('_provider') for m in sys.modules))"
+    assert _run(code) == "False"
+
+
+def test_lazy_attribute_resolves():
+    from searchly import AsyncKagiClient, KagiConfig
+    from searchly.providers.kagi_provider.client import AsyncKagiClient as Direct
+
+    assert AsyncKagiClient is Direct
+    assert KagiConfig.model_fields["type"].default == "kagi"
+
+
+def test_exa_module_does_not_import_sdk():
+    code = "import sys; import searchly.providers.exa_provider.exa; print('exa_py' in sys.modules)"
+    assert _run(code) == "False"
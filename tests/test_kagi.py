@@ -0,0 +1,142 @@
+"""Tests for the Kagi client using a mocked transport."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import anyenv
+import httpx
+import pytest
+
+from searchly.providers.kagi_provider.client import AsyncKagiClient
+
+
+SEARCH_PAYLOAD: dict[str, Any] = {
+    "meta": {"id": "abc"},
+    "data": [
+        {"t": 0, "url": "https://a.example", "title": "A", "snippet": "first"},
+        {"t": 0, "url": "https://b.example", "title": "B", "snippet": None},
+        {"t": 0, "url": "", "title": "No URL"},
+        {"url": "https://untyped.example", "title": "No type"},
+        {"t": 1, "list": ["related query"]},
+    ],
+}
+
+
+async def test_web_search_filters_results():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=SEARCH_PAYLOAD)
+
+    async with AsyncKagiClient(
+        api_key="test-key", transport=httpx.MockTransport(handler)
+    ) as client:
+        response = await client.web_search("python", max_results=5)
+
+    assert [r.url for r in response.results] == ["https://a.example", "https://b.example"]
+    assert response.results[1].snippet == ""
+    assert requests[0].url.path == "/api/v0/search"
+    assert requests[0].url.params["q"] == "python"
+    assert requests[0].headers["Authorization"] == "Bot test-key"
+
+
+async def test_summarize_returns_output():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["url"] == "https://python.org"
+        return httpx.Response(200, json={"data": {"output": "A summary.", "tokens": 3}})
+
+    async with AsyncKagiClient(
+        api_key="test-key", transport=httpx.MockTransport(handler)
+    ) as client:
+        assert await client.summarize(url="https://python.org") == "A summary."
+
+
+async def test_http_error_is_raised():
+    async with AsyncKagiClient(
+        api_key="test-key", transport=httpx.MockTransport(lambda request: httpx.Response(500))
+    ) as client:
+        with pytest.raises(anyenv.HttpError):
+            await client.web_search("python")
+
+
+async def test_batched_searches_are_demultiplexed():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        query = request.url.params["q"]
+        item = {"t": 0, "url": f"https://{query}.example", "title": query}
+        return httpx.Response(200, json={"data": [item]})
+
+    async with AsyncKagiClient(
+        api_key="test-key", transport=httpx.MockTransport(handler), batch=True, max_batch=2
+    ) as client:
+        queries = [f"q{i}" for i in range(5)]
+        responses = await asyncio.gather(*(client.web_search(q) for q in queries))
+
+    assert [r.results[0].title for r in responses] == queries
+    # Batches run concurrently instead of waiting for each other
+    assert peak == len(queries)
+
+
+async def test_close_cancels_in_flight_batches():
+    started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.sleep(10)
+        return httpx.Response(200, json=SEARCH_PAYLOAD)
+
+    client = AsyncKagiClient(api_key="test-key", transport=httpx.MockTransport(handler), batch=True)
+    search = asyncio.create_task(client.web_search("python"))
+    await started.wait()
+    await client.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(search, timeout=1)
+
+
+async def test_cache_coalesces_identical_requests():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=SEARCH_PAYLOAD)
+
+    async with AsyncKagiClient(
+        api_key="test-key", transport=httpx.MockTransport(handler), cache_ttl=60
+    ) as client:
+        first, second = await asyncio.gather(
+            client.web_search("python"), client.web_search("python")
+        )
+        assert await client.web_search("python") == first == second
+        assert calls == 1
+        await client.web_search("rust")
+        assert calls == 2  # noqa: PLR2004
+        client.cache_clear()
+        await client.web_search("python")
+        assert calls == 3  # noqa: PLR2004
+
+
+async def test_retries_rate_limited_responses():
+    responses = iter([httpx.Response(429), httpx.Response(200, json=SEARCH_PAYLOAD)])
+
+    async with AsyncKagiClient(
+        api_key="test-key",
+        transport=httpx.MockTransport(lambda request: next(responses)),
+        retries=1,
+        wait_time=0,
+    ) as client:
+        response = await client.web_search("python")
+
+    assert len(response.results) == 2  # noqa: PLR2004
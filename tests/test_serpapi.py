@@ -0,0 +1,81 @@
+"""Tests for the SerpAPI client against a local JSON server."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import anyenv
+import pytest
+
+from searchly.providers.serpapi_provider.client import AsyncSerpAPIClient
+
+
+if TYPE_CHECKING:
+    from tests.conftest import JSONServer
+
+
+@pytest.fixture
+def client(json_server: JSONServer) -> AsyncSerpAPIClient:
+    client = AsyncSerpAPIClient(api_key="test-key")
+    client.BACKEND = json_server.url
+    return client
+
+
+async def test_web_search_parses_organic_results(
+    client: AsyncSerpAPIClient, json_server: JSONServer
+):
+    organic = [
+        {"position": 1, "title": "A", "link": "https://a.example", "snippet": "first"},
+        {"position": 2, "title": "B", "link": "https://b.example"},
+        {"position": 3, "title": "C", "link": "https://c.example", "snippet": "third"},
+    ]
+    payload = {"search_metadata": {"status": "Success"}, "organic_results": organic}
+    json_server.responses["/search"] = (200, payload)
+
+    response = await client.web_search("python", max_results=2, country="DE", language="de")
+
+    assert [r.url for r in response.results] == ["https://a.example", "https://b.example"]
+    assert response.results[1].snippet == ""
+    _, params = json_server.requests[0]
+    assert params["q"] == ["python"]
+    assert params["engine"] == ["google"]
+    assert params["gl"] == ["de"]
+    assert params["safe"] == ["active"]
+    assert "tbm" not in params
+
+
+async def test_news_search_parses_news_results(client: AsyncSerpAPIClient, json_server: JSONServer):
+    news = [
+        {
+            "title": "A",
+            "link": "https://a.example",
+            "snippet": "first",
+            "source": "Example News",
+            "date": "2 hours ago",
+        },
+        {"title": "B", "link": "https://b.example"},
+    ]
+    json_server.responses["/search"] = (200, {"news_results": news})
+
+    response = await client.news_search("python", time_period="d")
+
+    assert response.results[0].source == "Example News"
+    assert response.results[0].published == "2 hours ago"
+    assert response.results[1].source is None
+    _, params = json_server.requests[0]
+    assert params["tbm"] == ["nws"]
+    assert params["tbs"] == ["qdr:d"]
+
+
+async def test_missing_results_key(client: AsyncSerpAPIClient, json_server: JSONServer):
+    json_server.responses["/search"] = (200, {"search_metadata": {"status": "Success"}})
+
+    assert (await client.web_search("python")).results == []
+    assert (await client.news_search("python")).results == []
+
+
+async def test_http_error_raises(client: AsyncSerpAPIClient, json_server: JSONServer):
+    json_server.responses["/search"] = (401, {"error": "Invalid API key."})
+
+    with pytest.raises(anyenv.HttpError):
+        await client.web_search("python")
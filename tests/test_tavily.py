@@ -0,0 +1,93 @@
+"""Tests for the Tavily client using a mocked transport."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import anyenv
+import httpx
+import pytest
+
+from searchly.exceptions import InvalidAPIKeyError, UsageLimitExceededError
+from searchly.providers.tavily_provider.client import AsyncTavilyClient
+
+
+SEARCH_PAYLOAD: dict[str, Any] = {
+    "query": "python",
+    "results": [
+        {
+            "title": "A",
+            "url": "https://a.example",
+            "content": "first",
+            "score": 0.9,
+            "published_date": "2026-01-01",
+        },
+        {"title": "B", "url": "https://b.example", "content": "second", "score": 0.5},
+    ],
+}
+
+
+async def test_web_search_parses_results():
+    bodies: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(anyenv.load_json(request.content, return_type=dict))
+        return httpx.Response(200, json=SEARCH_PAYLOAD)
+
+    async with AsyncTavilyClient(
+        api_key="test-key", transport=httpx.MockTransport(handler)
+    ) as client:
+        response = await client.web_search("python", max_results=1)
+
+    assert [r.url for r in response.results] == ["https://a.example"]
+    assert response.results[0].snippet == "first"
+    assert bodies[0]["query"] == "python"
+    assert bodies[0]["topic"] == "general"
+    assert "include_domains" not in bodies[0]
+    assert "exclude_domains" not in bodies[0]
+
+
+async def test_news_search_sends_domains():
+    bodies: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(anyenv.load_json(request.content, return_type=dict))
+        return httpx.Response(200, json=SEARCH_PAYLOAD)
+
+    async with AsyncTavilyClient(
+        api_key="test-key", transport=httpx.MockTransport(handler)
+    ) as client:
+        response = await client.news_search("python", include_domains=["a.example"])
+
+    assert response.results[0].published == "2026-01-01"
+    assert response.results[1].published is None
+    assert bodies[0]["topic"] == "news"
+    assert bodies[0]["include_domains"] == ["a.example"]
+
+
+async def test_missing_results_key():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"query": "python"}))
+    async with AsyncTavilyClient(api_key="test-key", transport=transport) as client:
+        assert (await client.web_search("python")).results == []
+
+
+async def test_rate_limit_detail_is_raised():
+    payload = {"detail": {"error": "Monthly limit reached."}}
+    transport = httpx.MockTransport(lambda request: httpx.Response(429, json=payload))
+    async with AsyncTavilyClient(api_key="test-key", transport=transport) as client:
+        with pytest.raises(UsageLimitExceededError, match="Monthly limit reached"):
+            await client.web_search("python")
+
+
+async def test_rate_limit_without_detail():
+    transport = httpx.MockTransport(lambda request: httpx.Response(429, text="slow down"))
+    async with AsyncTavilyClient(api_key="test-key", transport=transport) as client:
+        with pytest.raises(UsageLimitExceededError, match="Too many requests"):
+            await client.web_search("python")
+
+
+async def test_invalid_api_key():
+    transport = httpx.MockTransport(lambda request: httpx.Response(401))
+    async with AsyncTavilyClient(api_key="test-key", transport=transport) as client:
+        with pytest.raises(InvalidAPIKeyError):
+            await client.news_search("python")
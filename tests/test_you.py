@@ -0,0 +1,64 @@
+"""Tests for the You.com client using a mocked transport."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import anyenv
+import httpx
+import pytest
+
+from searchly.providers.you_provider.you import AsyncYouClient
+
+
+if TYPE_CHECKING:
+    from tests.conftest import JSONServer
+
+
+async def test_web_search_many_reuses_client():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        query = request.url.params["query"]
+        hits = [{"title": query, "url": f"https://{query}.example", "description": "d"}]
+        return httpx.Response(200, json={"hits": hits})
+
+    async with AsyncYouClient(api_key="test-key", transport=httpx.MockTransport(handler)) as client:
+        responses = await client.web_search_many(["a", "b", "c"], language="de")
+
+    assert [r.results[0].title for r in responses] == ["a", "b", "c"]
+    assert all(r.url.path == "/search" for r in requests)
+    assert all(r.url.params["language"] == "DE" for r in requests)
+    assert all(r.headers["X-API-Key"] == "test-key" for r in requests)
+    assert "country" not in requests[0].url.params
+
+
+async def test_news_search_defaults():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/news"
+        return httpx.Response(200, json={})
+
+    async with AsyncYouClient(api_key="test-key", transport=httpx.MockTransport(handler)) as client:
+        response = await client.news_search("python")
+
+    assert response.results == []
+
+
+async def test_http_error_raises():
+    async with AsyncYouClient(
+        api_key="test-key", transport=httpx.MockTransport(lambda request: httpx.Response(401))
+    ) as client:
+        with pytest.raises(anyenv.HttpError):
+            await client.web_search("python")
+
+
+def test_client_works_across_event_loops(json_server: JSONServer):
+    json_server.responses["/search"] = (200, {"hits": [{"title": "A", "url": "https://a.example"}]})
+    client = AsyncYouClient(api_key="test-key", base_url=json_server.url)
+    # Each asyncio.run() starts a new event loop, the keep-alive pool must not leak over
+    for _ in range(2):
+        response = asyncio.run(client.web_search("python"))
+        assert response.results[0].url == "https://a.example"
+    asyncio.run(client.close())